@@ -1,29 +1,39 @@
 #!/usr/bin/env python3
+import os
+
 import aws_cdk as cdk
 from infrastructure.meetup_dashboard_stack import MeetupDashboardStack
 from infrastructure.certificate_stack import CertificateStack
 
 app = cdk.App()
 
+# Single entry point for all stacks; account and regions can be overridden from the environment
+account = os.environ.get("MEETUP_DASHBOARD_ACCOUNT", "610251782643")  # Your AWS account ID
+
 # Environment configuration for main stack (ap-southeast-2)
 main_env = cdk.Environment(
-    account="610251782643",  # Your AWS account ID
-    region="ap-southeast-2"   # Your AWS region
+    account=account,
+    region=os.environ.get("MEETUP_DASHBOARD_REGION", "ap-southeast-2")   # Your AWS region
 )
 
 # Environment configuration for certificate stack (us-east-1 - required for CloudFront)
 cert_env = cdk.Environment(
-    account="610251782643",  # Your AWS account ID
+    account=account,
     region="us-east-1"       # Required for CloudFront certificates
 )
 
 # Deploy certificate stack first (in us-east-1)
-certificate_stack = CertificateStack(app, "CertificateStack", env=cert_env)
+certificate_stack = CertificateStack(app, "CertificateStack", env=cert_env, cross_region_references=True)
 
-# Deploy main stack (in ap-southeast-2)
-main_stack = MeetupDashboardStack(app, "MeetupDashboardStack", env=main_env)
+# Deploy main stack (in ap-southeast-2); the certificate ARN is passed across regions by CDK
+main_stack = MeetupDashboardStack(
+    app, "MeetupDashboardStack",
+    certificate=certificate_stack.certificate,
+    env=main_env,
+    cross_region_references=True
+)
 
 # Main stack depends on certificate stack
 main_stack.add_dependency(certificate_stack)
 
-app.synth()
\ No newline at end of file
+app.synth()
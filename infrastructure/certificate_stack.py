@@ -19,10 +19,11 @@ class CertificateStack(Stack):
         # Domain configuration
         domain_name = "projects.geethika.dev"
         
-        # Look up the existing hosted zone for geethika.dev
-        hosted_zone = route53.HostedZone.from_lookup(
+        # Reference the existing hosted zone for geethika.dev by ID (no lookup at synth time)
+        hosted_zone = route53.HostedZone.from_hosted_zone_attributes(
             self, "HostedZone",
-            domain_name="geethika.dev"
+            hosted_zone_id="Z02976432R3CE4B6YB5N6",
+            zone_name="geethika.dev"
         )
         
         # Create SSL certificate for the subdomain
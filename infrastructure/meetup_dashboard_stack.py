@@ -2,13 +2,13 @@ from aws_cdk import (
     Stack,
     Duration,
     CfnOutput,
-    Fn,
     aws_s3 as s3,
     aws_cloudfront as cloudfront,
     aws_cloudfront_origins as origins,
     aws_iam as iam,
     aws_lambda as _lambda,
-    aws_apigateway as apigateway,
+    aws_apigatewayv2 as apigwv2,
+    aws_apigatewayv2_integrations as apigwv2_integrations,
     aws_secretsmanager as secretsmanager,
     aws_certificatemanager as acm,
     aws_route53 as route53,
@@ -20,9 +20,22 @@ import json
 from constructs import Construct
 
 
+def make_s3_behavior(origin, cache_policy, function_associations=None):
+    """Build an HTTPS-only, GET/HEAD cache behavior for the S3 origin."""
+    return cloudfront.BehaviorOptions(
+        origin=origin,
+        viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+        cache_policy=cache_policy,
+        compress=True,
+        allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD,
+        cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD,
+        function_associations=function_associations,
+    )
+
+
 class MeetupDashboardStack(Stack):
 
-    def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
+    def __init__(self, scope: Construct, construct_id: str, certificate: acm.ICertificate = None, **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
         
         # Add DoNotNuke tag to all resources in this stack
@@ -35,172 +48,114 @@ class MeetupDashboardStack(Stack):
             public_read_access=False,  # Use OAC instead of public access
             block_public_access=s3.BlockPublicAccess.BLOCK_ALL,  # Block all public access
             removal_policy=RemovalPolicy.DESTROY,  # For development/testing
-            auto_delete_objects=True  # Clean up objects when stack is deleted
-        )
-        
-        # Add bucket policy to allow uploads from current account
-        self.website_bucket.add_to_resource_policy(
-            iam.PolicyStatement(
-                effect=iam.Effect.ALLOW,
-                principals=[iam.AccountRootPrincipal()],
-                actions=["s3:PutObject", "s3:PutObjectAcl", "s3:GetObject", "s3:DeleteObject"],
-                resources=[f"{self.website_bucket.bucket_arn}/*"]
-            )
-        )
-        
-        self.website_bucket.add_to_resource_policy(
-            iam.PolicyStatement(
-                effect=iam.Effect.ALLOW,
-                principals=[iam.AccountRootPrincipal()],
-                actions=["s3:ListBucket"],
-                resources=[self.website_bucket.bucket_arn]
-            )
+            auto_delete_objects=True,  # Clean up objects when stack is deleted
+            # Clean up parts left behind by interrupted multipart uploads; site objects must not expire
+            lifecycle_rules=[
+                s3.LifecycleRule(abort_incomplete_multipart_upload_after=Duration.days(1))
+            ]
         )
 
         # Domain configuration
         domain_name = "projects.geethika.dev"
         subdomain_path = "meetup-dashboard"
         
-        # Look up the existing hosted zone for geethika.dev
-        hosted_zone = route53.HostedZone.from_lookup(
+        # Reference the existing hosted zone for geethika.dev by ID (no lookup at synth time)
+        hosted_zone = route53.HostedZone.from_hosted_zone_attributes(
             self, "HostedZone",
-            domain_name="geethika.dev"
+            hosted_zone_id="Z02976432R3CE4B6YB5N6",
+            zone_name="geethika.dev"
         )
         
-        # Import certificate from the certificate stack (us-east-1)
-        # Note: Cross-region imports are not supported, so we use the hardcoded ARN
-        certificate_arn = "arn:aws:acm:us-east-1:610251782643:certificate/a227ab55-2bc9-4a2a-a508-a3224e52488a"
-        certificate = acm.Certificate.from_certificate_arn(
-            self, "ImportedCertificate",
-            certificate_arn=certificate_arn
+        # Create S3 origin with Origin Access Control (OAC) for better security. This also
+        # grants the distribution s3:GetObject in the bucket policy.
+        # No origin_path - files are accessed directly from S3 bucket structure
+        # Origin Shield in the bucket's region funnels edge cache misses through one regional cache
+        s3_origin = origins.S3BucketOrigin.with_origin_access_control(
+            self.website_bucket,
+            origin_shield_region=self.region
         )
 
-        # Create Origin Access Control explicitly using L1 construct
-        oac = cloudfront.CfnOriginAccessControl(
-            self, "OriginAccessControl",
-            origin_access_control_config=cloudfront.CfnOriginAccessControl.OriginAccessControlConfigProperty(
-                name="MeetupDashboard-OAC",
-                origin_access_control_origin_type="s3",
-                signing_behavior="always",
-                signing_protocol="sigv4",
-                description="Origin Access Control for Meetup Dashboard S3 bucket"
-            )
+        # Shorter TTL for HTML so content updates show up quickly
+        html_cache_policy = cloudfront.CachePolicy(
+            self, "HtmlCachePolicy",
+            cache_policy_name="HtmlCachePolicy",
+            default_ttl=Duration.minutes(5),
+            max_ttl=Duration.hours(1),
+            min_ttl=Duration.seconds(0),
+            query_string_behavior=cloudfront.CacheQueryStringBehavior.none(),
+            header_behavior=cloudfront.CacheHeaderBehavior.none(),
+            cookie_behavior=cloudfront.CacheCookieBehavior.none(),
+            # Objects are stored uncompressed; CloudFront compresses them per client at the edge
+            enable_accept_encoding_gzip=True,
+            enable_accept_encoding_brotli=True,
         )
 
-        # Create S3 origin with Origin Access Control (OAC) for better security
-        # No origin_path - files are accessed directly from S3 bucket structure
-        s3_origin = origins.S3BucketOrigin(
-            self.website_bucket
+        # Path pattern -> cache policy for the meetup-dashboard behaviors. CloudFront matches
+        # behaviors in order, so the HTML pattern must come before the /* catch-all.
+        behavior_cache_policies = [
+            # Exact path behavior for /meetup-dashboard (maps to /meetup-dashboard/index.html in S3)
+            (f"/{subdomain_path}", cloudfront.CachePolicy.CACHING_OPTIMIZED),
+            (f"/{subdomain_path}/*.html", html_cache_policy),
+            # Main behavior for all other /meetup-dashboard/* paths, including CSS/JS/images.
+            # CachingOptimized honours the Cache-Control they are uploaded with (a year for
+            # fingerprinted assets) and falls back to one day
+            (f"/{subdomain_path}/*", cloudfront.CachePolicy.CACHING_OPTIMIZED),
+        ]
+
+        # Rewrite extensionless dashboard URLs (/meetup-dashboard, /meetup-dashboard/, deep links)
+        # to the page at the edge, instead of failing at S3 and falling back via error responses
+        spa_rewrite_function = cloudfront.Function(
+            self, "SpaRewriteFunction",
+            comment="Serve the dashboard page for extensionless meetup-dashboard paths",
+            code=cloudfront.FunctionCode.from_inline(f"""
+function handler(event) {{
+    var request = event.request;
+    if (request.uri.split('/').pop().indexOf('.') === -1) {{
+        request.uri = '/{subdomain_path}/index.html';
+    }}
+    return request;
+}}
+""")
         )
+        spa_rewrite = [
+            cloudfront.FunctionAssociation(
+                function=spa_rewrite_function,
+                event_type=cloudfront.FunctionEventType.VIEWER_REQUEST
+            )
+        ]
 
         # Create CloudFront distribution with S3 origin (custom domain will be added later)
         distribution_props = {
-            "default_behavior": cloudfront.BehaviorOptions(
-                origin=s3_origin,
-                viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
-                # Use a cache policy that returns 404 for root path access
-                cache_policy=cloudfront.CachePolicy(
-                    self, "RootBlockCachePolicy",
-                    cache_policy_name="RootBlockCachePolicy",
-                    default_ttl=Duration.minutes(5),
-                    max_ttl=Duration.hours(1),
-                    min_ttl=Duration.seconds(0),
-                    query_string_behavior=cloudfront.CacheQueryStringBehavior.none(),
-                    header_behavior=cloudfront.CacheHeaderBehavior.none(),
-                    cookie_behavior=cloudfront.CacheCookieBehavior.none(),
-                ),
-                allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD,
-                cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD,
-            ),
+            # Nothing is served outside /meetup-dashboard; root access falls through to the
+            # error responses below
+            "default_behavior": make_s3_behavior(s3_origin, cloudfront.CachePolicy.CACHING_DISABLED),
             "additional_behaviors": {
-                # Exact path behavior for /meetup-dashboard (maps to /meetup-dashboard/index.html in S3)
-                "/meetup-dashboard": cloudfront.BehaviorOptions(
-                    origin=s3_origin,
-                    viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
-                    cache_policy=cloudfront.CachePolicy.CACHING_OPTIMIZED,
-                    allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD,
-                    cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD,
-                ),
-                # Main behavior for /meetup-dashboard/* paths
-                "/meetup-dashboard/*": cloudfront.BehaviorOptions(
-                    origin=s3_origin,
-                    viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
-                    cache_policy=cloudfront.CachePolicy.CACHING_OPTIMIZED,
-                    allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD,
-                    cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD,
-                ),
-                # Cache behavior for HTML files in meetup-dashboard - shorter TTL for content updates
-                "/meetup-dashboard/*.html": cloudfront.BehaviorOptions(
-                    origin=s3_origin,
-                    viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
-                    cache_policy=cloudfront.CachePolicy(
-                        self, "HtmlCachePolicy",
-                        cache_policy_name="HtmlCachePolicy",
-                        default_ttl=Duration.minutes(5),
-                        max_ttl=Duration.hours(1),
-                        min_ttl=Duration.seconds(0),
-                        query_string_behavior=cloudfront.CacheQueryStringBehavior.none(),
-                        header_behavior=cloudfront.CacheHeaderBehavior.none(),
-                        cookie_behavior=cloudfront.CacheCookieBehavior.none(),
-                    ),
-                    allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD,
-                    cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD,
-                ),
-                # Cache behavior for CSS/JS files in meetup-dashboard - longer TTL for performance
-                "/meetup-dashboard/*.css": cloudfront.BehaviorOptions(
-                    origin=s3_origin,
-                    viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
-                    cache_policy=cloudfront.CachePolicy(
-                        self, "StaticAssetsCachePolicy",
-                        cache_policy_name="StaticAssetsCachePolicy",
-                        default_ttl=Duration.days(1),
-                        max_ttl=Duration.days(7),
-                        min_ttl=Duration.seconds(0),
-                        query_string_behavior=cloudfront.CacheQueryStringBehavior.none(),
-                        header_behavior=cloudfront.CacheHeaderBehavior.none(),
-                        cookie_behavior=cloudfront.CacheCookieBehavior.none(),
-                    ),
-                    allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD,
-                    cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD,
-                ),
-                "/meetup-dashboard/*.js": cloudfront.BehaviorOptions(
-                    origin=s3_origin,
-                    viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
-                    cache_policy=cloudfront.CachePolicy(
-                        self, "JsCachePolicy",
-                        cache_policy_name="JsCachePolicy",
-                        default_ttl=Duration.days(1),
-                        max_ttl=Duration.days(7),
-                        min_ttl=Duration.seconds(0),
-                        query_string_behavior=cloudfront.CacheQueryStringBehavior.none(),
-                        header_behavior=cloudfront.CacheHeaderBehavior.none(),
-                        cookie_behavior=cloudfront.CacheCookieBehavior.none(),
-                    ),
-                    allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD,
-                    cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD,
-                ),
+                path_pattern: make_s3_behavior(s3_origin, cache_policy, spa_rewrite)
+                for path_pattern, cache_policy in behavior_cache_policies
             },
             "default_root_object": "index.html",  # Serves 404 page for root access
             "comment": "Meetup Dashboard CloudFront Distribution with OAC",
+            # Fallback for paths the rewrite does not cover (root access, missing files). Errors are
+            # not cached, so a transient origin 403/404 (e.g. mid-deploy) is not pinned at the edge
             "error_responses": [
                 # Handle 403 errors by serving the index.html file for the dashboard
                 cloudfront.ErrorResponse(
                     http_status=403,
                     response_http_status=200,
                     response_page_path="/meetup-dashboard/index.html",
-                    ttl=Duration.minutes(5)
+                    ttl=Duration.seconds(0)
                 ),
                 # Handle 404 errors by serving the index.html file for the dashboard
                 cloudfront.ErrorResponse(
                     http_status=404,
                     response_http_status=200,
                     response_page_path="/meetup-dashboard/index.html",
-                    ttl=Duration.minutes(5)
+                    ttl=Duration.seconds(0)
                 )
             ]
         }
         
-        # Add custom domain if certificate is available
+        # Add custom domain if a certificate (from the us-east-1 certificate stack) is passed in
         if certificate:
             distribution_props["domain_names"] = [domain_name]
             distribution_props["certificate"] = certificate
@@ -210,31 +165,6 @@ class MeetupDashboardStack(Stack):
             **distribution_props
         )
 
-        # Use escape hatch to add OAC to the CloudFront distribution
-        cfn_distribution = self.distribution.node.default_child
-        cfn_distribution.add_property_override(
-            "DistributionConfig.Origins.0.OriginAccessControlId",
-            oac.attr_id
-        )
-        
-        # Add dependency to ensure OAC is created before distribution
-        self.distribution.node.add_dependency(oac)
-
-        # Add bucket policy for CloudFront OAC access
-        self.website_bucket.add_to_resource_policy(
-            iam.PolicyStatement(
-                effect=iam.Effect.ALLOW,
-                principals=[iam.ServicePrincipal("cloudfront.amazonaws.com")],
-                actions=["s3:GetObject"],
-                resources=[f"{self.website_bucket.bucket_arn}/*"],
-                conditions={
-                    "StringEquals": {
-                        "AWS:SourceArn": f"arn:aws:cloudfront::{self.account}:distribution/{self.distribution.distribution_id}"
-                    }
-                }
-            )
-        )
-
         # Create Route 53 A record pointing to CloudFront distribution
         route53.ARecord(
             self, "AliasRecord",
@@ -243,41 +173,6 @@ class MeetupDashboardStack(Stack):
             target=route53.RecordTarget.from_alias(targets.CloudFrontTarget(self.distribution))
         )
 
-        # Grant CloudFront access to S3 bucket using Origin Access Control
-        # This is automatically handled by S3BucketOrigin with OAC
-
-        # Output the custom domain URL with /meetup-dashboard path
-        CfnOutput(
-            self, "CustomDomainUrl",
-            value=f"https://{domain_name}/meetup-dashboard",
-            description="Custom Domain URL for Meetup Dashboard",
-            export_name="MeetupDashboardStack-CustomDomainUrl"
-        )
-
-        # Output the CloudFront domain name for testing
-        CfnOutput(
-            self, "CloudFrontDomainName",
-            value=self.distribution.distribution_domain_name,
-            description="CloudFront Distribution Domain Name",
-            export_name="MeetupDashboardStack-CloudFrontDomainName"
-        )
-
-        # Output the S3 bucket name for reference
-        CfnOutput(
-            self, "S3BucketName",
-            value=self.website_bucket.bucket_name,
-            description="S3 Bucket Name for Static Website",
-            export_name="MeetupDashboardStack-S3BucketName"
-        )
-
-        # Output the S3 website URL for reference
-        CfnOutput(
-            self, "S3WebsiteURL",
-            value=self.website_bucket.bucket_website_url,
-            description="S3 Static Website URL",
-            export_name="MeetupDashboardStack-S3WebsiteURL"
-        )
-
         # Create secret for Meetup credentials with placeholder values
         meetup_secret = secretsmanager.Secret(
             self, "MeetupCredentials",
@@ -294,63 +189,118 @@ class MeetupDashboardStack(Stack):
             )
         )
 
-        # Create Lambda function for Meetup API
-        self.meetup_lambda = _lambda.Function(
-            self, "MeetupApiFunction",
-            runtime=_lambda.Runtime.PYTHON_3_9,
-            handler="lambda_function.lambda_handler",
-            code=_lambda.Code.from_asset("src/lambda"),
-            timeout=Duration.seconds(30),
-            environment={
-                "MEETUP_SECRET_NAME": meetup_secret.secret_name
-            }
+        # Provisioned concurrency for the API aliases, e.g. `cdk deploy -c provisioned_concurrency=1`.
+        # Lambda does not allow SnapStart together with provisioned concurrency, so SnapStart is
+        # only enabled when no environments are provisioned.
+        provisioned_concurrency = int(self.node.try_get_context("provisioned_concurrency") or 0)
+        snap_start = None if provisioned_concurrency else _lambda.SnapStartConf.ON_PUBLISHED_VERSIONS
+        
+        # Memory also sets the CPU share, which speeds up init (imports, TLS handshakes)
+        lambda_memory_size = int(self.node.try_get_context("lambda_memory_size") or 1024)
+
+        # Execution role shared by both functions, which need the same permissions
+        lambda_role = iam.Role(
+            self, "LambdaExecutionRole",
+            assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
+            managed_policies=[
+                iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSLambdaBasicExecutionRole")
+            ]
         )
         
         # Grant Lambda permission to read the secret
-        meetup_secret.grant_read(self.meetup_lambda)
+        meetup_secret.grant_read(lambda_role)
 
-        # Create API Gateway
-        self.api = apigateway.RestApi(
-            self, "MeetupApi",
-            rest_api_name="Meetup Dashboard API",
-            default_cors_preflight_options=apigateway.CorsOptions(
-                allow_origins=apigateway.Cors.ALL_ORIGINS,
-                allow_methods=apigateway.Cors.ALL_METHODS,
+        def make_api_function(construct_id, handler_module, other_handler_module):
+            """Create an API handler function and the "live" alias API Gateway invokes."""
+            function = _lambda.Function(
+                self, construct_id,
+                runtime=_lambda.Runtime.PYTHON_3_12,
+                architecture=_lambda.Architecture.ARM_64,
+                handler=f"{handler_module}.lambda_handler",
+                # Ship this function's handler and the shared meetup_graphql and warm_cache modules
+                # (not the other handler); boto3 and urllib3 come with the runtime
+                code=_lambda.Code.from_asset("src/lambda", exclude=[f"{other_handler_module}.py", "__pycache__"]),
+                memory_size=lambda_memory_size,
+                role=lambda_role,
+                timeout=Duration.seconds(10),
+                # Snapshot the initialized environment so cold starts skip interpreter and import time
+                snap_start=snap_start,
+                environment={
+                    "MEETUP_SECRET_NAME": meetup_secret.secret_name
+                }
+            )
+            # SnapStart and provisioned concurrency only apply to published versions, so API Gateway invokes an alias
+            alias = _lambda.Alias(
+                self, f"{construct_id}Alias",
+                alias_name="live",
+                version=function.current_version,
+                provisioned_concurrent_executions=provisioned_concurrency or None
+            )
+            return function, alias
+
+        # Create Lambda functions for the Meetup API and group details
+        self.meetup_lambda, meetup_lambda_alias = make_api_function(
+            "MeetupApiFunction", "lambda_function", "group_details_function"
+        )
+        self.group_details_lambda, group_details_lambda_alias = make_api_function(
+            "GroupDetailsFunction", "group_details_function", "lambda_function"
+        )
+        
+        # Create API Gateway HTTP API; CORS preflight is answered by API Gateway itself.
+        # The id differs from the old REST API's "MeetupApi" so CloudFormation replaces it
+        # instead of attempting an in-place resource type change.
+        self.api = apigwv2.HttpApi(
+            self, "MeetupHttpApi",
+            api_name="Meetup Dashboard API",
+            create_default_stage=False,
+            cors_preflight=apigwv2.CorsPreflightOptions(
+                allow_origins=["*"],
+                allow_methods=[apigwv2.CorsHttpMethod.ANY],
                 allow_headers=["Content-Type", "Authorization"]
             )
         )
 
-        # Create Lambda integration
-        lambda_integration = apigateway.LambdaIntegration(self.meetup_lambda)
+        # Keep the /prod/<resource> paths the frontend already calls
+        self.api_stage = apigwv2.HttpStage(
+            self, "MeetupApiProdStage",
+            http_api=self.api,
+            stage_name="prod",
+            auto_deploy=True
+        )
 
-        # Add API Gateway resource and method
-        meetup_resource = self.api.root.add_resource("meetup")
-        meetup_resource.add_method("POST", lambda_integration)
+        # Create Lambda integration; payload format 1.0 keeps the REST-style event the handlers expect
+        lambda_integration = apigwv2_integrations.HttpLambdaIntegration(
+            "MeetupApiIntegration",
+            meetup_lambda_alias,
+            payload_format_version=apigwv2.PayloadFormatVersion.VERSION_1_0
+        )
 
-        # Create Lambda function for group details
-        self.group_details_lambda = _lambda.Function(
-            self, "GroupDetailsFunction",
-            runtime=_lambda.Runtime.PYTHON_3_9,
-            handler="group_details_function.lambda_handler",
-            code=_lambda.Code.from_asset("src/lambda"),
-            timeout=Duration.seconds(30),
-            environment={
-                "MEETUP_SECRET_NAME": meetup_secret.secret_name
-            }
+        # Add API Gateway route; GET takes no body, so the browser can cache it and skip the CORS preflight
+        self.api.add_routes(
+            path="/meetup",
+            methods=[apigwv2.HttpMethod.GET, apigwv2.HttpMethod.POST],
+            integration=lambda_integration
         )
-        
-        # Grant Lambda permission to read the secret
-        meetup_secret.grant_read(self.group_details_lambda)
 
-        # Add group details resource and method
-        group_details_resource = self.api.root.add_resource("group-details")
-        group_details_integration = apigateway.LambdaIntegration(self.group_details_lambda)
-        group_details_resource.add_method("POST", group_details_integration)
+        # Add group details route
+        group_details_integration = apigwv2_integrations.HttpLambdaIntegration(
+            "GroupDetailsIntegration",
+            group_details_lambda_alias,
+            payload_format_version=apigwv2.PayloadFormatVersion.VERSION_1_0
+        )
+        self.api.add_routes(
+            path="/group-details",
+            methods=[apigwv2.HttpMethod.POST],
+            integration=group_details_integration
+        )
 
-        # Output API Gateway URL
-        CfnOutput(
-            self, "ApiGatewayUrl",
-            value=self.api.url,
-            description="API Gateway URL for Meetup integration",
-            export_name="MeetupDashboardStack-ApiGatewayUrl"
-        )
\ No newline at end of file
+        # Stack outputs read by the deployment scripts from cdk-outputs.json: (id, value, description).
+        # No other stack imports them, so they are not exported.
+        outputs = [
+            ("CustomDomainUrl", f"https://{domain_name}/{subdomain_path}", "Custom Domain URL for Meetup Dashboard"),
+            ("CloudFrontDomainName", self.distribution.distribution_domain_name, "CloudFront Distribution Domain Name"),
+            ("S3BucketName", self.website_bucket.bucket_name, "S3 Bucket Name for Static Website"),
+            ("ApiGatewayUrl", self.api_stage.url, "API Gateway URL for Meetup integration"),
+        ]
+        for output_id, value, description in outputs:
+            CfnOutput(self, output_id, value=value, description=description)
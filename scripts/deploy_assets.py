@@ -5,10 +5,78 @@ Sets appropriate content-type headers for different file types
 """
 
 import boto3
+from boto3.s3.transfer import TransferConfig, TransferManager
+from botocore.config import Config
+from botocore.exceptions import ClientError
+import hashlib
 import json
+import logging
 import os
 import mimetypes
-from pathlib import Path
+import sys
+import time
+import urllib3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Upload workers log through a single handler so each file's lines are written together
+logger = logging.getLogger("deploy_assets")
+logger.addHandler(logging.StreamHandler(sys.stdout))
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# Uploads are I/O-bound, so oversubscribe the CPU count (boto3 clients are thread-safe)
+MAX_UPLOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Multipart settings so large files are uploaded as parallel 8MB parts
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# Content-Type and Cache-Control by file extension:
+# CSS/JS/images cached for 30 days, HTML for 5 minutes and served stale for up to a day
+# while it revalidates. CSS/JS/SVG are fingerprinted by main() and uploaded with
+# IMMUTABLE_CACHE_CONTROL instead; deploy_static.sh uses these values for them.
+ASSET_HEADERS = {
+    '.css': ('text/css', 'max-age=2592000'),
+    '.js': ('application/javascript', 'max-age=2592000'),
+    '.svg': ('image/svg+xml', 'max-age=2592000'),
+    '.png': ('image/png', 'max-age=2592000'),
+    '.jpg': ('image/jpeg', 'max-age=2592000'),
+    '.jpeg': ('image/jpeg', 'max-age=2592000'),
+    '.gif': ('image/gif', 'max-age=2592000'),
+    '.ico': ('image/x-icon', 'max-age=2592000'),
+    '.html': ('text/html', 'max-age=300, stale-while-revalidate=86400'),
+}
+
+# CSS/JS/SVG are uploaded under content-hashed keys (styles.<md5>.css) so they never change
+# once published and can be cached indefinitely; pages are rewritten to reference them
+FINGERPRINT_EXTENSIONS = {'.css', '.js', '.svg'}
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Placeholder in index.html that receives the API base URL, so the page follows the
+# execute-api hostname of the current deployment
+API_BASE_URL_META = '<meta name="api-base-url" content="">'
+
+# Files below this size are sent with a single in-memory PutObject call
+PUT_OBJECT_MAX_SIZE = 5 * 1024 * 1024
+
+# Shared S3 client settings: enough pooled keep-alive connections for the worker threads,
+# and adaptive retries so S3 throttling slows the client down instead of failing requests
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'max_attempts': 10, 'mode': 'adaptive'}
+)
+
+# Keep-alive connection pool shared by all verification requests
+HTTP_POOL = urllib3.PoolManager(
+    num_pools=4,
+    maxsize=16,
+    retries=urllib3.Retry(total=3, backoff_factor=0.2)
+)
 
 def load_cdk_outputs():
     """Load CDK outputs to get S3 bucket name"""
@@ -23,342 +91,245 @@ def load_cdk_outputs():
         print("Error: MeetupDashboardStack outputs not found in cdk-outputs.json")
         return None
 
+def get_asset_headers(file_path):
+    """Get (content-type, cache-control) for file; cache-control is None for unknown types"""
+    _, file_extension = os.path.splitext(file_path)
+    headers = ASSET_HEADERS.get(file_extension.lower())
+    if headers:
+        return headers
+    
+    content_type, _ = mimetypes.guess_type(file_path)
+    return content_type or 'application/octet-stream', None
+
 def get_content_type(file_path):
     """Get appropriate content-type for file"""
-    content_type, _ = mimetypes.guess_type(file_path)
+    return get_asset_headers(file_path)[0]
+
+def file_md5(local_file):
+    """Compute the hex MD5 of a file without reading it into memory at once"""
+    md5 = hashlib.md5()
+    with open(local_file, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+def is_object_unchanged(s3_client, bucket_name, s3_key, local_md5, extra_args):
+    """Check whether the S3 object already has this content and these headers
     
-    # Override for specific file types
-    file_extension = Path(file_path).suffix.lower()
-    if file_extension == '.svg':
-        return 'image/svg+xml'
-    elif file_extension == '.css':
-        return 'text/css'
-    elif file_extension == '.js':
-        return 'application/javascript'
-    elif file_extension == '.html':
-        return 'text/html'
+    Relies on the ETag being the content MD5, which holds for single-part uploads only;
+    multipart objects never match and are always re-uploaded.
+    """
+    try:
+        response = s3_client.head_object(Bucket=bucket_name, Key=s3_key)
+    except ClientError:
+        return False
     
-    return content_type or 'application/octet-stream'
+    return (
+        response['ETag'].strip('"') == local_md5
+        and response.get('ContentType') == extra_args.get('ContentType')
+        and response.get('CacheControl') == extra_args.get('CacheControl')
+    )
+
+def fingerprint_key(local_file, s3_key):
+    """Insert a short content hash before the extension, e.g. styles.css -> styles.1a2b3c4d.css"""
+    root, extension = os.path.splitext(s3_key)
+    return f"{root}.{file_md5(local_file)[:8]}{extension}"
+
+def rewrite_asset_references(body, fingerprints):
+    """Point quoted asset file names in a page at their fingerprinted names"""
+    text = body.decode('utf-8')
+    for file_name, fingerprinted_name in fingerprints.items():
+        text = text.replace(f'"{file_name}"', f'"{fingerprinted_name}"')
+    return text.encode('utf-8')
 
-def upload_file_to_s3(s3_client, bucket_name, local_file, s3_key):
-    """Upload a single file to S3 with appropriate content-type"""
+def inject_api_base_url(body, api_base_url):
+    """Fill the page's api-base-url meta tag with the deployed API base URL"""
+    return body.replace(
+        API_BASE_URL_META.encode('utf-8'),
+        f'<meta name="api-base-url" content="{api_base_url}">'.encode('utf-8')
+    )
+
+def upload_file_to_s3(s3_client, transfer_manager, bucket_name, local_file, s3_key, cache_control=None, fingerprints=None, api_base_url=None):
+    """Upload a single file to S3 with appropriate content-type
+    
+    cache_control overrides the per-extension default; fingerprints maps asset file names to
+    their fingerprinted names and api_base_url fills the api-base-url meta tag, both applied
+    to HTML pages before upload.
+    
+    Runs on a worker thread, so messages are buffered and logged in one call at the end
+    to keep each file's output together.
+    """
+    messages = []
     try:
-        content_type = get_content_type(local_file)
+        content_type, default_cache_control = get_asset_headers(local_file)
+        cache_control = cache_control or default_cache_control
         
         # Additional headers for web assets
         extra_args = {
             'ContentType': content_type,
         }
+        if cache_control:
+            extra_args['CacheControl'] = cache_control
         
-        # Add cache control headers for different file types
-        file_extension = Path(local_file).suffix.lower()
-        if file_extension in ['.css', '.js']:
-            # Cache CSS and JS files for 1 day
-            extra_args['CacheControl'] = 'max-age=86400'
-        elif file_extension in ['.svg', '.png', '.jpg', '.jpeg', '.gif', '.ico']:
-            # Cache images for 7 days
-            extra_args['CacheControl'] = 'max-age=604800'
-        elif file_extension == '.html':
-            # Cache HTML files for 5 minutes
-            extra_args['CacheControl'] = 'max-age=300'
+        # Pages are always rewritten in memory, whatever their size, so a large page never goes
+        # out unrewritten; other small assets skip the transfer manager's threading and
+        # multipart bookkeeping. Either way the body is sent with one PutObject.
+        body = None
+        if content_type == 'text/html' or os.path.getsize(local_file) < PUT_OBJECT_MAX_SIZE:
+            with open(local_file, 'rb') as f:
+                body = f.read()
+            
+            if content_type == 'text/html':
+                if fingerprints:
+                    body = rewrite_asset_references(body, fingerprints)
+                if api_base_url:
+                    body = inject_api_base_url(body, api_base_url)
         
-        print(f"Uploading {local_file} to s3://{bucket_name}/{s3_key}")
-        print(f"  Content-Type: {content_type}")
+        # Skip files whose content and headers already match the object in S3
+        local_md5 = hashlib.md5(body).hexdigest() if body is not None else file_md5(local_file)
+        if is_object_unchanged(s3_client, bucket_name, s3_key, local_md5, extra_args):
+            messages.append(f"= {local_file} is unchanged in s3://{bucket_name}/{s3_key}, skipping")
+            return True
+        
+        messages.append(f"Uploading {local_file} to s3://{bucket_name}/{s3_key}")
+        messages.append(f"  Content-Type: {content_type}")
         if 'CacheControl' in extra_args:
-            print(f"  Cache-Control: {extra_args['CacheControl']}")
+            messages.append(f"  Cache-Control: {extra_args['CacheControl']}")
         
-        s3_client.upload_file(
-            local_file,
-            bucket_name,
-            s3_key,
-            ExtraArgs=extra_args
-        )
+        # Transient failures (throttling, connection resets) are retried by the client (S3_CLIENT_CONFIG)
+        if body is not None:
+            s3_client.put_object(Bucket=bucket_name, Key=s3_key, Body=body, **extra_args)
+        else:
+            transfer_manager.upload(
+                local_file,
+                bucket_name,
+                s3_key,
+                extra_args=extra_args
+            ).result()
         
-        print(f"✓ Successfully uploaded {local_file}")
+        messages.append(f"✓ Successfully uploaded {local_file}")
         return True
         
     except Exception as e:
-        print(f"✗ Error uploading {local_file}: {str(e)}")
+        messages.append(f"✗ Error uploading {local_file}: {str(e)}")
         return False
+    finally:
+        logger.info("\n".join(messages))
 
-def enable_public_read_access(s3_client, bucket_name):
-    """Temporarily enable public read access for S3 static website testing"""
-    try:
-        # Create bucket policy for public read access
-        bucket_policy = {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Sid": "PublicReadGetObject",
-                    "Effect": "Allow",
-                    "Principal": "*",
-                    "Action": "s3:GetObject",
-                    "Resource": f"arn:aws:s3:::{bucket_name}/*"
-                }
-            ]
-        }
-        
-        s3_client.put_bucket_policy(
-            Bucket=bucket_name,
-            Policy=json.dumps(bucket_policy)
-        )
-        print(f"✓ Temporarily enabled public read access for bucket {bucket_name}")
-        return True
-    except Exception as e:
-        print(f"✗ Failed to enable public read access: {str(e)}")
-        return False
+def fetch_urls(urls, timeout):
+    """GET all URLs concurrently, returning the response or the raised exception for each"""
+    def fetch(url):
+        try:
+            return HTTP_POOL.request('GET', url, timeout=timeout)
+        except urllib3.exceptions.HTTPError as e:
+            return e
+    
+    with ThreadPoolExecutor(max_workers=max(len(urls), 1)) as executor:
+        return list(executor.map(fetch, urls))
 
-def disable_public_read_access(s3_client, bucket_name):
-    """Disable public read access after testing"""
-    try:
-        s3_client.delete_bucket_policy(Bucket=bucket_name)
-        print(f"✓ Disabled public read access for bucket {bucket_name}")
-        return True
-    except Exception as e:
-        print(f"✗ Failed to disable public read access: {str(e)}")
-        return False
+def wait_for_object(s3_client, bucket_name, s3_key, max_attempts=5, base_delay=0.2):
+    """HEAD an object, backing off exponentially until it is visible; returns None or the last error"""
+    for attempt in range(max_attempts):
+        try:
+            s3_client.head_object(Bucket=bucket_name, Key=s3_key)
+            return None
+        except Exception as e:
+            if attempt == max_attempts - 1:
+                return e
+            time.sleep(base_delay * 2 ** attempt)
+
+def head_objects(s3_client, bucket_name, s3_keys):
+    """HEAD all keys concurrently, returning (key, error) pairs where error is None if the object exists"""
+    def head(s3_key):
+        return s3_key, wait_for_object(s3_client, bucket_name, s3_key)
+    
+    with ThreadPoolExecutor(max_workers=max(len(s3_keys), 1)) as executor:
+        return list(executor.map(head, s3_keys))
 
-def verify_s3_access_with_subdirectory(s3_client, bucket_name, s3_website_url, cloudfront_domain, subdirectory, custom_domain_url):
-    """Verify files are accessible through S3 static website endpoint and CloudFront with subdirectory"""
-    import requests
-    import time
+def verify_s3_access_with_subdirectory(s3_client, bucket_name, cloudfront_domain, subdirectory, custom_domain_url, object_checks=None, test_files=None):
+    """Verify files exist in S3 and are accessible through CloudFront with subdirectory
     
+    object_checks may carry (key, error) pairs already gathered while uploading, skipping the HEAD phase.
+    test_files overrides the file names to check, e.g. with fingerprinted names.
+    """
     print(f"\nVerifying files are accessible under '{subdirectory}/' prefix...")
     
     # Test files to verify
-    test_files = ['index.html', 'styles.css', 'script.js', 'error.html', 'favicon.svg']
-    
-    # Wait a moment for S3 to propagate
-    print("Waiting 5 seconds for S3 to propagate changes...")
-    time.sleep(5)
+    if test_files is None:
+        test_files = ['index.html', 'styles.css', 'script.js', 'error.html', 'favicon.svg']
     
     # First, verify files exist in S3 bucket using boto3
     print(f"\n1. Verifying files exist in S3 bucket: {bucket_name}")
     s3_files_exist = True
-    for file_name in test_files:
-        try:
-            s3_key = f"{subdirectory}/{file_name}"
-            s3_client.head_object(Bucket=bucket_name, Key=s3_key)
+    if object_checks is None:
+        s3_keys = [f"{subdirectory}/{file_name}" for file_name in test_files]
+        object_checks = head_objects(s3_client, bucket_name, s3_keys)
+    for s3_key, error in object_checks:
+        if error is None:
             print(f"✓ {s3_key} exists in S3 bucket")
-        except Exception as e:
-            print(f"✗ {s3_key} not found in S3 bucket: {str(e)}")
+        else:
+            print(f"✗ {s3_key} not found in S3 bucket: {str(error)}")
             s3_files_exist = False
     
-    # Temporarily enable public read access for S3 website testing
-    print(f"\n2. Temporarily enabling public read access for S3 website testing...")
-    public_access_enabled = enable_public_read_access(s3_client, bucket_name)
-    
-    if public_access_enabled:
-        # Wait for policy to propagate
-        print("Waiting 10 seconds for bucket policy to propagate...")
-        time.sleep(10)
-        
-        # Test S3 website endpoint
-        print(f"\n3. Testing S3 static website endpoint: {s3_website_url}")
-        s3_website_accessible = True
-        for file_name in test_files:
-            try:
-                url = f"{s3_website_url}/{subdirectory}/{file_name}"
-                response = requests.get(url, timeout=10)
-                
-                if response.status_code == 200:
-                    print(f"✓ {file_name} is accessible via S3 website (Status: {response.status_code})")
-                    
-                    # Verify content-type header
-                    content_type = response.headers.get('content-type', 'unknown')
-                    expected_type = get_content_type(file_name)
-                    if expected_type.split(';')[0] in content_type:
-                        print(f"  Content-Type: {content_type} ✓")
-                    else:
-                        print(f"  Content-Type: {content_type} (expected: {expected_type})")
-                        
-                else:
-                    print(f"✗ {file_name} returned status {response.status_code} via S3 website")
-                    s3_website_accessible = False
-                    
-            except requests.RequestException as e:
-                print(f"✗ Error accessing {file_name} via S3 website: {str(e)}")
-                s3_website_accessible = False
-        
-        # Disable public read access after testing
-        print(f"\n4. Disabling public read access (restoring security)...")
-        disable_public_read_access(s3_client, bucket_name)
-    else:
-        s3_website_accessible = False
-        print("Skipping S3 website endpoint test due to policy configuration failure")
-    
-    # Test CloudFront distribution
-    print(f"\n5. Testing CloudFront distribution: https://{cloudfront_domain}")
+    # Test CloudFront distribution; the bucket is private, so this is the only public path to it
+    print(f"\n2. Testing CloudFront distribution: https://{cloudfront_domain}")
     print("Note: CloudFront may take several minutes to serve new content due to caching and propagation")
     cloudfront_accessible = True
-    for file_name in test_files:
-        try:
-            url = f"https://{cloudfront_domain}/{subdirectory}/{file_name}"
-            response = requests.get(url, timeout=15)
-            
-            if response.status_code == 200:
-                print(f"✓ {file_name} is accessible via CloudFront (Status: {response.status_code})")
+    urls = [f"https://{cloudfront_domain}/{subdirectory}/{file_name}" for file_name in test_files]
+    for file_name, response in zip(test_files, fetch_urls(urls, timeout=15)):
+        if isinstance(response, urllib3.exceptions.HTTPError):
+            print(f"✗ Error accessing {file_name} via CloudFront: {str(response)}")
+            cloudfront_accessible = False
+            continue
+        
+        if response.status == 200:
+            print(f"✓ {file_name} is accessible via CloudFront (Status: {response.status})")
                 
-                # Verify content-type header
-                content_type = response.headers.get('content-type', 'unknown')
-                expected_type = get_content_type(file_name)
-                if expected_type.split(';')[0] in content_type:
-                    print(f"  Content-Type: {content_type} ✓")
-                else:
-                    print(f"  Content-Type: {content_type} (expected: {expected_type})")
-                    
+            # Verify content-type header
+            content_type = response.headers.get('content-type', 'unknown')
+            expected_type = get_content_type(file_name)
+            if expected_type.split(';')[0] in content_type:
+                print(f"  Content-Type: {content_type} ✓")
             else:
-                print(f"✗ {file_name} returned status {response.status_code} via CloudFront")
-                if response.status_code == 403:
-                    print(f"  Note: CloudFront may need time to propagate changes or origin access may need configuration")
-                cloudfront_accessible = False
-                
-        except requests.RequestException as e:
-            print(f"✗ Error accessing {file_name} via CloudFront: {str(e)}")
+                print(f"  Content-Type: {content_type} (expected: {expected_type})")
+                    
+        else:
+            print(f"✗ {file_name} returned status {response.status} via CloudFront")
+            if response.status == 403:
+                print(f"  Note: CloudFront may need time to propagate changes or origin access may need configuration")
             cloudfront_accessible = False
     
     # Test custom domain if configured
     custom_domain_accessible = True
     if custom_domain_url != 'Not configured':
-        print(f"\n6. Testing custom domain: {custom_domain_url}")
+        print(f"\n3. Testing custom domain: {custom_domain_url}")
         print("Note: Custom domain may take time to propagate DNS and SSL certificate")
-        for file_name in test_files:
-            try:
-                url = f"{custom_domain_url.rstrip('/')}/{file_name}"
-                response = requests.get(url, timeout=15)
-                
-                if response.status_code == 200:
-                    print(f"✓ {file_name} is accessible via custom domain (Status: {response.status_code})")
-                else:
-                    print(f"✗ {file_name} returned status {response.status_code} via custom domain")
-                    if response.status_code in [403, 502, 503]:
-                        print(f"  Note: Custom domain may need time to propagate DNS and SSL certificate")
-                    custom_domain_accessible = False
-                    
-            except requests.RequestException as e:
-                print(f"✗ Error accessing {file_name} via custom domain: {str(e)}")
+        urls = [f"{custom_domain_url.rstrip('/')}/{file_name}" for file_name in test_files]
+        for file_name, response in zip(test_files, fetch_urls(urls, timeout=15)):
+            if isinstance(response, urllib3.exceptions.HTTPError):
+                print(f"✗ Error accessing {file_name} via custom domain: {str(response)}")
                 print(f"  Note: This is expected if DNS hasn't propagated yet")
                 custom_domain_accessible = False
+                continue
+            
+            if response.status == 200:
+                print(f"✓ {file_name} is accessible via custom domain (Status: {response.status})")
+            else:
+                print(f"✗ {file_name} returned status {response.status} via custom domain")
+                if response.status in [403, 502, 503]:
+                    print(f"  Note: Custom domain may need time to propagate DNS and SSL certificate")
+                custom_domain_accessible = False
     
     # Summary
     print(f"\n=== Verification Summary ===")
     print(f"Files exist in S3 bucket: {'✓' if s3_files_exist else '✗'}")
-    print(f"S3 website endpoint accessible: {'✓' if s3_website_accessible else '✗'}")
     print(f"CloudFront distribution accessible: {'✓' if cloudfront_accessible else '✗'}")
     if custom_domain_url != 'Not configured':
         print(f"Custom domain accessible: {'✓' if custom_domain_accessible else '✗ (may need DNS propagation time)'}")
     
-    # Return True if files exist in S3 and S3 website endpoint works
+    # Return True if files exist in S3
     # (CloudFront and custom domain may take time to propagate)
-    return s3_files_exist and s3_website_accessible
-
-def verify_s3_access(s3_client, bucket_name, s3_website_url, cloudfront_domain):
-    """Verify files are accessible through S3 static website endpoint and CloudFront"""
-    import requests
-    import time
-    
-    print(f"\nVerifying files are accessible...")
-    
-    # Test files to verify
-    test_files = ['index.html', 'styles.css', 'script.js', 'error.html', 'favicon.svg']
-    
-    # Wait a moment for S3 to propagate
-    print("Waiting 5 seconds for S3 to propagate changes...")
-    time.sleep(5)
-    
-    # First, verify files exist in S3 bucket using boto3
-    print(f"\n1. Verifying files exist in S3 bucket: {bucket_name}")
-    s3_files_exist = True
-    for file_name in test_files:
-        try:
-            s3_client.head_object(Bucket=bucket_name, Key=file_name)
-            print(f"✓ {file_name} exists in S3 bucket")
-        except Exception as e:
-            print(f"✗ {file_name} not found in S3 bucket: {str(e)}")
-            s3_files_exist = False
-    
-    # Temporarily enable public read access for S3 website testing
-    print(f"\n2. Temporarily enabling public read access for S3 website testing...")
-    public_access_enabled = enable_public_read_access(s3_client, bucket_name)
-    
-    if public_access_enabled:
-        # Wait for policy to propagate
-        print("Waiting 10 seconds for bucket policy to propagate...")
-        time.sleep(10)
-        
-        # Test S3 website endpoint
-        print(f"\n3. Testing S3 static website endpoint: {s3_website_url}")
-        s3_website_accessible = True
-        for file_name in test_files:
-            try:
-                url = f"{s3_website_url}/{file_name}"
-                response = requests.get(url, timeout=10)
-                
-                if response.status_code == 200:
-                    print(f"✓ {file_name} is accessible via S3 website (Status: {response.status_code})")
-                    
-                    # Verify content-type header
-                    content_type = response.headers.get('content-type', 'unknown')
-                    expected_type = get_content_type(file_name)
-                    if expected_type.split(';')[0] in content_type:
-                        print(f"  Content-Type: {content_type} ✓")
-                    else:
-                        print(f"  Content-Type: {content_type} (expected: {expected_type})")
-                        
-                else:
-                    print(f"✗ {file_name} returned status {response.status_code} via S3 website")
-                    s3_website_accessible = False
-                    
-            except requests.RequestException as e:
-                print(f"✗ Error accessing {file_name} via S3 website: {str(e)}")
-                s3_website_accessible = False
-        
-        # Disable public read access after testing
-        print(f"\n4. Disabling public read access (restoring security)...")
-        disable_public_read_access(s3_client, bucket_name)
-    else:
-        s3_website_accessible = False
-        print("Skipping S3 website endpoint test due to policy configuration failure")
-    
-    # Test CloudFront distribution
-    print(f"\n5. Testing CloudFront distribution: https://{cloudfront_domain}")
-    print("Note: CloudFront may take several minutes to serve new content due to caching and propagation")
-    cloudfront_accessible = True
-    for file_name in test_files:
-        try:
-            url = f"https://{cloudfront_domain}/{file_name}"
-            response = requests.get(url, timeout=15)
-            
-            if response.status_code == 200:
-                print(f"✓ {file_name} is accessible via CloudFront (Status: {response.status_code})")
-                
-                # Verify content-type header
-                content_type = response.headers.get('content-type', 'unknown')
-                expected_type = get_content_type(file_name)
-                if expected_type.split(';')[0] in content_type:
-                    print(f"  Content-Type: {content_type} ✓")
-                else:
-                    print(f"  Content-Type: {content_type} (expected: {expected_type})")
-                    
-            else:
-                print(f"✗ {file_name} returned status {response.status_code} via CloudFront")
-                if response.status_code == 403:
-                    print(f"  Note: CloudFront may need time to propagate changes or origin access may need configuration")
-                cloudfront_accessible = False
-                
-        except requests.RequestException as e:
-            print(f"✗ Error accessing {file_name} via CloudFront: {str(e)}")
-            cloudfront_accessible = False
-    
-    # Summary
-    print(f"\n=== Verification Summary ===")
-    print(f"Files exist in S3 bucket: {'✓' if s3_files_exist else '✗'}")
-    print(f"S3 website endpoint accessible: {'✓' if s3_website_accessible else '✗'}")
-    print(f"CloudFront distribution accessible: {'✓' if cloudfront_accessible else '✗'}")
-    
-    # Return True if files exist in S3 and S3 website endpoint works
-    # (CloudFront may take time to propagate, so we focus on S3 website for immediate verification)
-    return s3_files_exist and s3_website_accessible
+    return s3_files_exist
 
 def main():
     """Main deployment function"""
@@ -370,20 +341,22 @@ def main():
         return False
     
     bucket_name = outputs['S3BucketName']
-    s3_website_url = outputs['S3WebsiteURL']
     cloudfront_domain = outputs['CloudFrontDomainName']
     custom_domain_url = outputs.get('CustomDomainUrl', 'Not configured')
+    # The stage URL ends with a slash; the frontend appends /meetup etc. itself
+    api_base_url = outputs['ApiGatewayUrl'].rstrip('/')
     
     print(f"S3 Bucket: {bucket_name}")
-    print(f"S3 Website URL: {s3_website_url}")
     print(f"CloudFront Domain: {cloudfront_domain}")
     print(f"Custom Domain URL: {custom_domain_url}")
+    print(f"API Base URL: {api_base_url}")
     print()
     
-    # Initialize S3 client with gg-admin profile
+    # Initialize S3 client with gg-admin profile. The client is thread-safe, so this single
+    # instance is shared by every upload and verification worker.
     try:
         session = boto3.Session(profile_name='gg-admin')
-        s3_client = session.client('s3')
+        s3_client = session.client('s3', config=S3_CLIENT_CONFIG)
         print("✓ AWS session initialized with gg-admin profile")
     except Exception as e:
         print(f"✗ Error initializing AWS session: {str(e)}")
@@ -404,15 +377,43 @@ def main():
     
     print(f"\nUploading {len(files_to_upload)} files to S3 under '{subdirectory}/' prefix...")
     
-    # Upload each file
-    upload_success = True
+    # Fingerprint CSS/JS/SVG keys; pages are uploaded after them so they never reference a missing asset
+    fingerprints = {}
+    assets, pages = [], []
     for local_file, s3_key in files_to_upload:
-        if os.path.exists(local_file):
-            success = upload_file_to_s3(s3_client, bucket_name, local_file, s3_key)
-            if not success:
-                upload_success = False
-        else:
+        if not os.path.exists(local_file):
             print(f"✗ Warning: {local_file} not found, skipping...")
+        elif os.path.splitext(local_file)[1].lower() in FINGERPRINT_EXTENSIONS:
+            fingerprinted_key = fingerprint_key(local_file, s3_key)
+            fingerprints[os.path.basename(s3_key)] = os.path.basename(fingerprinted_key)
+            assets.append((local_file, fingerprinted_key, IMMUTABLE_CACHE_CONTROL))
+        else:
+            pages.append((local_file, s3_key, None))
+    
+    # Upload files concurrently - each PUT is an independent network round-trip.
+    # As each upload finishes, confirm the object with HEAD while the rest are still in flight.
+    upload_success = True
+    with TransferManager(s3_client, TRANSFER_CONFIG) as transfer_manager, \
+            ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor, \
+            ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as verify_executor:
+        verify_futures = []
+        for batch in (assets, pages):
+            if not upload_success:
+                break
+            
+            futures = {
+                executor.submit(upload_file_to_s3, s3_client, transfer_manager, bucket_name,
+                                local_file, s3_key, cache_control, fingerprints, api_base_url): s3_key
+                for local_file, s3_key, cache_control in batch
+            }
+            for future in as_completed(futures):
+                if future.result():
+                    s3_key = futures[future]
+                    verify_futures.append((s3_key, verify_executor.submit(wait_for_object, s3_client, bucket_name, s3_key)))
+                else:
+                    upload_success = False
+        
+        object_checks = [(s3_key, verify_future.result()) for s3_key, verify_future in verify_futures]
     
     if not upload_success:
         print("\n✗ Some files failed to upload")
@@ -421,12 +422,12 @@ def main():
     print(f"\n✓ All files uploaded successfully to s3://{bucket_name}/{subdirectory}/")
     
     # Verify files are accessible (update verification to use subdirectory)
-    verification_success = verify_s3_access_with_subdirectory(s3_client, bucket_name, s3_website_url, cloudfront_domain, subdirectory, custom_domain_url)
+    verification_success = verify_s3_access_with_subdirectory(s3_client, bucket_name, cloudfront_domain, subdirectory, custom_domain_url, object_checks,
+                                                              [os.path.basename(s3_key) for s3_key, _ in object_checks])
     
     if verification_success:
         print(f"\n✓ Files are accessible and deployment completed successfully!")
         print(f"\nYour website is now available at:")
-        print(f"  S3 Website URL: {s3_website_url}/{subdirectory}/")
         print(f"  CloudFront URL: https://{cloudfront_domain}/{subdirectory}/")
         if custom_domain_url != 'Not configured':
             print(f"  Custom Domain URL: {custom_domain_url}")
@@ -13,16 +13,31 @@ if [ -z "$BUCKET" ]; then
   exit 1
 fi
 
+# API base URL for the page's api-base-url meta tag (stage URL without the trailing slash)
+API_BASE_URL=$(aws cloudformation describe-stacks --stack-name MeetupDashboardStack --query 'Stacks[0].Outputs[?OutputKey==`ApiGatewayUrl`].OutputValue' --output text $PROFILE_ARG)
+API_BASE_URL=${API_BASE_URL%/}
+
+if [ -z "$API_BASE_URL" ]; then
+  echo "❌ Could not find API Gateway URL from CloudFormation stack"
+  exit 1
+fi
+
 # Subdirectory for the meetup dashboard
 SUBDIRECTORY="meetup-dashboard"
 
 echo "📦 Uploading static content to $BUCKET/$SUBDIRECTORY/ using profile: $PROFILE..."
 
-aws s3 cp src/web/index.html s3://$BUCKET/$SUBDIRECTORY/ --content-type "text/html" $PROFILE_ARG && \
-aws s3 cp src/web/styles.css s3://$BUCKET/$SUBDIRECTORY/ --content-type "text/css" $PROFILE_ARG && \
-aws s3 cp src/web/script.js s3://$BUCKET/$SUBDIRECTORY/ --content-type "application/javascript" $PROFILE_ARG && \
-aws s3 cp src/web/error.html s3://$BUCKET/$SUBDIRECTORY/ --content-type "text/html" $PROFILE_ARG && \
-aws s3 cp src/web/favicon.svg s3://$BUCKET/$SUBDIRECTORY/ --content-type "image/svg+xml" $PROFILE_ARG
+# Same Cache-Control as deploy_assets.py: pages for 5 minutes (served stale for up to a day
+# while revalidating), unfingerprinted CSS/JS/SVG for 30 days
+PAGE_CACHE_CONTROL="max-age=300, stale-while-revalidate=86400"
+ASSET_CACHE_CONTROL="max-age=2592000"
+
+sed "s|<meta name=\"api-base-url\" content=\"\">|<meta name=\"api-base-url\" content=\"$API_BASE_URL\">|" src/web/index.html | \
+  aws s3 cp - s3://$BUCKET/$SUBDIRECTORY/index.html --content-type "text/html" --cache-control "$PAGE_CACHE_CONTROL" $PROFILE_ARG && \
+aws s3 cp src/web/styles.css s3://$BUCKET/$SUBDIRECTORY/ --content-type "text/css" --cache-control "$ASSET_CACHE_CONTROL" $PROFILE_ARG && \
+aws s3 cp src/web/script.js s3://$BUCKET/$SUBDIRECTORY/ --content-type "application/javascript" --cache-control "$ASSET_CACHE_CONTROL" $PROFILE_ARG && \
+aws s3 cp src/web/error.html s3://$BUCKET/$SUBDIRECTORY/ --content-type "text/html" --cache-control "$PAGE_CACHE_CONTROL" $PROFILE_ARG && \
+aws s3 cp src/web/favicon.svg s3://$BUCKET/$SUBDIRECTORY/ --content-type "image/svg+xml" --cache-control "$ASSET_CACHE_CONTROL" $PROFILE_ARG
 
 if [ $? -eq 0 ]; then
   echo "✅ Static content deployed successfully to $SUBDIRECTORY/ subdirectory!"
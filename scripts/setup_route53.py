@@ -11,7 +11,8 @@ from botocore.exceptions import ClientError
 def check_hosted_zone_exists(route53_client, domain_name):
     """Check if hosted zone already exists for the domain"""
     try:
-        response = route53_client.list_hosted_zones()
+        # Zones are returned sorted by name starting at DNSName, so an existing zone is the first result
+        response = route53_client.list_hosted_zones_by_name(DNSName=domain_name, MaxItems='1')
         for zone in response['HostedZones']:
             if zone['Name'].rstrip('.') == domain_name:
                 return zone
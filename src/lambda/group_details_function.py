@@ -1,36 +1,20 @@
 import json
-import os
-import urllib.request
-import urllib.parse
 import logging
-import boto3
+
+from meetup_graphql import graphql_call, invocation_deadline
+from warm_cache import get_secret
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-def get_secret():
-    """Get credentials from AWS Secrets Manager."""
-    secret_name = os.environ.get('MEETUP_SECRET_NAME')
-    if not secret_name:
-        logger.error("MEETUP_SECRET_NAME environment variable not set")
-        return None
-    
-    session = boto3.session.Session()
-    client = session.client('secretsmanager', region_name='ap-southeast-2')
-    
-    try:
-        logger.info(f"Getting secret: {secret_name}")
-        response = client.get_secret_value(SecretId=secret_name)
-        return json.loads(response['SecretString'])
-    except Exception as e:
-        logger.error(f"Error getting secret: {e}")
-        return None
-
 def lambda_handler(event, context):
     """Lambda function to fetch detailed group information."""
     
-    logger.info(f"Group details Lambda invoked with event: {json.dumps(event, default=str)}")
+    deadline = invocation_deadline(context)
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Group details Lambda invoked with event: %s", json.dumps(event, default=str))
     
     # Handle CORS preflight requests
     if event.get('httpMethod') == 'OPTIONS':
@@ -61,7 +45,7 @@ def lambda_handler(event, context):
                 'body': json.dumps({'error': 'groupId is required'})
             }
         
-        logger.info(f"Fetching details for group ID: {group_id}")
+        logger.info("Fetching details for group ID: %s", group_id)
         
         # Get credentials from Secrets Manager
         credentials = get_secret()
@@ -82,9 +66,9 @@ def lambda_handler(event, context):
         
         if not client_secret or not access_token:
             logger.warning("Missing required credentials in secret, returning mock data")
-            logger.info(f"Credentials status - Client ID: SET (hardcoded)")
-            logger.info(f"Credentials status - Client Secret: {'SET' if client_secret else 'NOT SET'}")
-            logger.info(f"Credentials status - Access Token: {'SET' if access_token else 'NOT SET'}")
+            logger.info("Credentials status - Client ID: SET (hardcoded)")
+            logger.info("Credentials status - Client Secret: %s", 'SET' if client_secret else 'NOT SET')
+            logger.info("Credentials status - Access Token: %s", 'SET' if access_token else 'NOT SET')
             mock_data = {
                 'success': True,
                 'data': {
@@ -109,13 +93,13 @@ def lambda_handler(event, context):
         # Get pro network urlname from credentials
         pro_urlname = credentials.get('MEETUP_PRO_URLNAME', 'aws-user-groups-new-zealand')
         
-        logger.info(f"Making GraphQL call for group {group_id} in pro network: {pro_urlname}")
+        logger.info("Making GraphQL call for group %s in pro network: %s", group_id, pro_urlname)
         
         # Fetch group events using direct group query
         events_query = """
         query ($id: ID!) {
           group(id: $id){
-            events(status: PAST, sort: DESC){
+            events(status: PAST, sort: DESC, input: {first: 10}){
               totalCount
               pageInfo {
                 endCursor
@@ -134,14 +118,18 @@ def lambda_handler(event, context):
         """
         
         variables = {"id": group_id}
-        result = graphql_call(client_id, client_secret, access_token, events_query, variables)
-        logger.info(f"GraphQL response: {json.dumps(result, default=str)}")
+        result = graphql_call(access_token, events_query, variables, deadline, headers={
+            "X-Meetup-Client-Id": client_id,
+            "X-Meetup-Client-Secret": client_secret[:10] + "..."
+        })
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GraphQL response: %s", json.dumps(result, default=str))
         
         if 'data' in result and result['data']['group']:
             events_data = result['data']['group']['events']
             events = [edge['node'] for edge in events_data['edges']]
             
-            logger.info(f"Successfully extracted {events_data['totalCount']} total events, showing {len(events[:10])}")
+            logger.info("Successfully extracted %d total events, showing %d", events_data['totalCount'], len(events[:10]))
             
             response_data = {
                 'success': True,
@@ -161,7 +149,7 @@ def lambda_handler(event, context):
                 'body': json.dumps(response_data)
             }
         else:
-            logger.error(f"Invalid response structure or no events found: {result}")
+            logger.error("Invalid response structure or no events found: %s", result)
             return {
                 'statusCode': 404,
                 'headers': {
@@ -172,7 +160,7 @@ def lambda_handler(event, context):
             }
             
     except Exception as e:
-        logger.error(f"Exception occurred: {str(e)}", exc_info=True)
+        logger.error("Exception occurred: %s", e, exc_info=True)
         return {
             'statusCode': 500,
             'headers': {
@@ -181,49 +169,3 @@ def lambda_handler(event, context):
             },
             'body': json.dumps({'error': str(e)})
         }
-
-def graphql_call(client_id, client_secret, access_token, query, variables=None):
-    """Make authenticated GraphQL API call using urllib with both client credentials and access token."""
-    logger.info("Starting GraphQL API call for group details")
-    
-    payload = {"query": query}
-    if variables:
-        payload["variables"] = variables
-        logger.info(f"GraphQL variables: {variables}")
-    
-    data = json.dumps(payload).encode('utf-8')
-    logger.info(f"GraphQL payload size: {len(data)} bytes")
-    
-    req = urllib.request.Request(
-        "https://api.meetup.com/gql-ext",
-        data=data,
-        headers={
-            "Authorization": f"Bearer {access_token[:10]}...",
-            "Content-Type": "application/json",
-            "X-Meetup-Client-Id": client_id,
-            "X-Meetup-Client-Secret": client_secret[:10] + "..."
-        }
-    )
-    
-    logger.info("Making HTTP request to Meetup GraphQL API")
-    
-    try:
-        with urllib.request.urlopen(req) as response:
-            logger.info(f"HTTP response status: {response.status}")
-            response_data = response.read().decode('utf-8')
-            logger.info(f"Response data size: {len(response_data)} bytes")
-            
-            parsed_response = json.loads(response_data)
-            logger.info("Successfully parsed JSON response")
-            return parsed_response
-            
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        logger.error(f"HTTP Error {e.code}: {error_body}")
-        raise Exception(f"GraphQL call failed: {e.code} - {error_body}")
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {str(e)}")
-        raise Exception(f"Failed to parse JSON response: {str(e)}")
-    except Exception as e:
-        logger.error(f"Unexpected error in GraphQL call: {str(e)}")
-        raise Exception(f"GraphQL call failed: {str(e)}")
\ No newline at end of file
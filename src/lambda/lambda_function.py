@@ -1,38 +1,62 @@
 import json
-import os
-import urllib.request
-import urllib.parse
 import logging
-import boto3
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+from meetup_graphql import graphql_call, invocation_deadline
+from warm_cache import GRAPHQL_CACHE_TTL_SECONDS, get_secret
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-def get_secret():
-    """Get credentials from AWS Secrets Manager."""
-    secret_name = os.environ.get('MEETUP_SECRET_NAME')
-    if not secret_name:
-        logger.error("MEETUP_SECRET_NAME environment variable not set")
-        return None
-    
-    session = boto3.session.Session()
-    client = session.client('secretsmanager', region_name='ap-southeast-2')
-    
-    try:
-        logger.info(f"Getting secret: {secret_name}")
-        response = client.get_secret_value(SecretId=secret_name)
-        return json.loads(response['SecretString'])
-    except Exception as e:
-        logger.error(f"Error getting secret: {e}")
-        return None
+# Fetch pro network analytics, groups and each group's events from the last 12 months in one call.
+# Only the 50 most recent events per group are returned; totalCount still covers the whole year.
+COMBINED_QUERY = """
+query ($urlname: ID!, $afterDateTime: DateTime!) {
+  proNetwork(urlname: $urlname) {
+    networkAnalytics{
+      totalCountries
+      totalGroups
+      totalMembers
+    }
+    groupsSearch(input: {desc: false}) {
+      totalCount
+      pageInfo {
+        endCursor
+      }
+      edges {
+        node {
+          id
+          country
+          name
+          foundedDate
+          stats{ memberCounts {all} }
+          events(status: PAST, sort: DESC, filter: {afterDateTime: $afterDateTime}, input: {first: 50}) {
+            totalCount
+            edges {
+              node {
+                rsvps {
+                  totalCount
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
 
 def lambda_handler(event, context):
     """Lambda function to fetch Meetup data and return analytics."""
     
-    logger.info(f"Lambda invoked with event: {json.dumps(event, default=str)}")
-    logger.info(f"Context: {context}")
+    deadline = invocation_deadline(context)
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Lambda invoked with event: %s", json.dumps(event, default=str))
+    logger.info("Context: %s", context)
     
     # Handle CORS preflight requests
     if event.get('httpMethod') == 'OPTIONS':
@@ -41,7 +65,7 @@ def lambda_handler(event, context):
             'statusCode': 200,
             'headers': {
                 'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'POST, OPTIONS',
+                'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
                 'Access-Control-Allow-Headers': 'Content-Type'
             },
             'body': ''
@@ -67,10 +91,10 @@ def lambda_handler(event, context):
     access_token = credentials.get('MEETUP_ACCESS_TOKEN')
     pro_urlname = credentials.get('MEETUP_PRO_URLNAME')
     
-    logger.info(f"Environment variables - Client ID: SET (hardcoded)")
-    logger.info(f"Environment variables - Client Secret: {'SET' if client_secret else 'NOT SET'}")
-    logger.info(f"Environment variables - Access Token: {'SET' if access_token else 'NOT SET'}")
-    logger.info(f"Environment variables - Pro URL Name: {pro_urlname if pro_urlname else 'NOT SET'}")
+    logger.info("Environment variables - Client ID: SET (hardcoded)")
+    logger.info("Environment variables - Client Secret: %s", 'SET' if client_secret else 'NOT SET')
+    logger.info("Environment variables - Access Token: %s", 'SET' if access_token else 'NOT SET')
+    logger.info("Environment variables - Pro URL Name: %s", pro_urlname if pro_urlname else 'NOT SET')
     
     if not all([client_secret, access_token, pro_urlname]):
         logger.warning("Missing environment variables, returning mock data")
@@ -103,7 +127,7 @@ def lambda_handler(event, context):
             },
             'note': 'Mock data - configure environment variables for real data'
         }
-        logger.info(f"Returning mock data: {mock_data}")
+        logger.info("Returning mock data: %s", mock_data)
         return {
             'statusCode': 200,
             'headers': {
@@ -117,94 +141,24 @@ def lambda_handler(event, context):
         logger.info("All environment variables present, attempting real API call")
         
         # Calculate date one year ago
-        one_year_ago = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%dT%H:%M:%S+12:00')
-        
-        # Fetch pro network analytics and groups
-        combined_query = """
-        query ($urlname: ID!) {
-          proNetwork(urlname: $urlname) {
-            networkAnalytics{
-              totalCountries
-              totalGroups
-              totalMembers
-            }
-            groupsSearch(input: {desc: false}) {
-              totalCount
-              pageInfo {
-                endCursor
-              }
-              edges {
-                node {
-                  id
-                  country
-                  name
-                  foundedDate
-                  stats{ memberCounts {all} }
-                }
-              }
-            }
-          }
-        }
-        """
+        one_year_ago = one_year_ago_iso(datetime.now(timezone.utc).date())
         
-        logger.info(f"Making GraphQL call for pro network: {pro_urlname}")
-        result = graphql_call(access_token, combined_query, {"urlname": pro_urlname})
-        logger.info(f"GraphQL response: {json.dumps(result, default=str)}")
+        logger.info("Making GraphQL call for pro network: %s", pro_urlname)
+        result = graphql_call(access_token, COMBINED_QUERY, {
+            "urlname": pro_urlname,
+            "afterDateTime": one_year_ago
+        }, deadline)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GraphQL response: %s", json.dumps(result, default=str))
         
         if 'data' in result and result['data']['proNetwork']:
             pro_network = result['data']['proNetwork']
             analytics = pro_network['networkAnalytics']
             groups_data = pro_network['groupsSearch']
-            groups = [edge['node'] for edge in groups_data['edges']]
+            groups = [build_group_summary(edge['node']) for edge in groups_data['edges']]
             
-            logger.info(f"Successfully extracted analytics: {analytics}")
-            logger.info(f"Successfully extracted {len(groups)} groups")
-            
-            # Fetch events count for each group in the last 12 months
-            for group in groups:
-                try:
-                    events_query = """
-                    query ($id: ID!, $afterDateTime: DateTime!) {
-                      group(id: $id) {
-                        events(status: PAST, sort: DESC, filter: {afterDateTime: $afterDateTime}) {
-                          totalCount
-                          pageInfo {
-                            endCursor
-                          }
-                          edges {
-                            node {
-                              rsvps {
-                                totalCount
-                              }
-                            }
-                          }
-                        }
-                      }
-                    }
-                    """
-                    
-                    events_result = graphql_call(access_token, events_query, {
-                        "id": group['id'],
-                        "afterDateTime": one_year_ago
-                    })
-                    
-                    if 'data' in events_result and events_result['data']['group']:
-                        events_data = events_result['data']['group']['events']
-                        group['eventsLast12Months'] = events_data['totalCount']
-                        
-                        # Calculate average RSVPs
-                        if events_data['edges']:
-                            total_rsvps = sum(edge['node']['rsvps']['totalCount'] for edge in events_data['edges'])
-                            group['avgRsvpsLast12Months'] = round(total_rsvps / len(events_data['edges']), 1)
-                        else:
-                            group['avgRsvpsLast12Months'] = 0
-                    else:
-                        group['eventsLast12Months'] = 0
-                        group['avgRsvpsLast12Months'] = 0
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to fetch events for group {group['id']}: {str(e)}")
-                    group['eventsLast12Months'] = 0
+            logger.info("Successfully extracted analytics: %s", analytics)
+            logger.info("Successfully extracted %d groups", len(groups))
             
             response_data = {
                 'success': True,
@@ -215,18 +169,20 @@ def lambda_handler(event, context):
                     'groups': groups
                 }
             }
-            logger.info(f"Returning successful response with {len(groups)} groups")
+            logger.info("Returning successful response with %d groups", len(groups))
             
             return {
                 'statusCode': 200,
                 'headers': {
                     'Access-Control-Allow-Origin': '*',
-                    'Content-Type': 'application/json'
+                    'Content-Type': 'application/json',
+                    # Let browsers reuse the analytics for as long as the GraphQL cache holds them
+                    'Cache-Control': f'public, max-age={GRAPHQL_CACHE_TTL_SECONDS}'
                 },
                 'body': json.dumps(response_data)
             }
         else:
-            logger.error(f"Invalid response structure: {analytics_result}")
+            logger.error("Invalid response structure: %s", result)
             error_response = {'error': 'Failed to fetch analytics data'}
             return {
                 'statusCode': 500,
@@ -238,7 +194,7 @@ def lambda_handler(event, context):
             }
             
     except Exception as e:
-        logger.error(f"Exception occurred: {str(e)}", exc_info=True)
+        logger.error("Exception occurred: %s", e, exc_info=True)
         error_response = {'error': str(e)}
         return {
             'statusCode': 500,
@@ -249,46 +205,34 @@ def lambda_handler(event, context):
             'body': json.dumps(error_response)
         }
 
-def graphql_call(access_token, query, variables=None):
-    """Make authenticated GraphQL API call using urllib."""
-    logger.info("Starting GraphQL API call")
-    
-    payload = {"query": query}
-    if variables:
-        payload["variables"] = variables
-        logger.info(f"GraphQL variables: {variables}")
-    
-    data = json.dumps(payload).encode('utf-8')
-    logger.info(f"GraphQL payload size: {len(data)} bytes")
-    
-    req = urllib.request.Request(
-        "https://api.meetup.com/gql-ext",
-        data=data,
-        headers={
-            "Authorization": f"Bearer {access_token[:10]}...",  # Log partial token for security
-            "Content-Type": "application/json"
-        }
-    )
+
+@lru_cache(maxsize=1)
+def one_year_ago_iso(today):
+    """Return UTC midnight 365 days before the given date as an ISO 8601 timestamp.
+
+    Truncating to the day keeps the afterDateTime variable, and so the GraphQL cache key,
+    stable across invocations on the same day.
+    """
+    midnight = datetime(today.year, today.month, today.day, tzinfo=timezone.utc)
+    return (midnight - timedelta(days=365)).isoformat(timespec='seconds')
+
+def build_group_summary(node):
+    """Copy a group node, replacing its nested events with eventsLast12Months and avgRsvpsLast12Months."""
+    group = {key: value for key, value in node.items() if key != 'events'}
+    events_data = node.get('events')
     
-    logger.info("Making HTTP request to Meetup GraphQL API")
+    if events_data:
+        group['eventsLast12Months'] = events_data['totalCount']
+        
+        # Calculate average RSVPs in a single pass over the (at most 50 most recent) event edges
+        total_rsvps = 0
+        event_count = 0
+        for edge in events_data['edges']:
+            total_rsvps += edge['node']['rsvps']['totalCount']
+            event_count += 1
+        group['avgRsvpsLast12Months'] = round(total_rsvps / event_count, 1) if event_count else 0
+    else:
+        group['eventsLast12Months'] = 0
+        group['avgRsvpsLast12Months'] = 0
     
-    try:
-        with urllib.request.urlopen(req) as response:
-            logger.info(f"HTTP response status: {response.status}")
-            response_data = response.read().decode('utf-8')
-            logger.info(f"Response data size: {len(response_data)} bytes")
-            
-            parsed_response = json.loads(response_data)
-            logger.info("Successfully parsed JSON response")
-            return parsed_response
-            
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        logger.error(f"HTTP Error {e.code}: {error_body}")
-        raise Exception(f"GraphQL call failed: {e.code} - {error_body}")
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {str(e)}")
-        raise Exception(f"Failed to parse JSON response: {str(e)}")
-    except Exception as e:
-        logger.error(f"Unexpected error in GraphQL call: {str(e)}")
-        raise Exception(f"GraphQL call failed: {str(e)}")
\ No newline at end of file
+    return group
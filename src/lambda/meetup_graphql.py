@@ -0,0 +1,146 @@
+"""Meetup GraphQL client shared by the Lambda handlers."""
+import json
+import logging
+import random
+import time
+import urllib3
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from warm_cache import cache_response, get_cached_response
+
+logger = logging.getLogger()
+
+MEETUP_GRAPHQL_URL = "https://api.meetup.com/gql-ext"
+
+# Keep-alive pool reused by GraphQL calls across warm invocations. Retries are done by
+# graphql_call against the invocation's deadline rather than by urllib3, which has no
+# overall time limit across attempts and would wait out any Retry-After.
+http = urllib3.PoolManager(maxsize=10, block=True, retries=False)
+
+# Throttled (429) and transient 5xx responses, and failed connects, are retried with
+# exponential backoff and full jitter, so concurrent instances do not retry in lockstep,
+# while time remains. A Retry-After is honoured when it ends before the deadline. GraphQL
+# queries are read-only so retrying the POST is safe. A read timeout is not retried.
+GRAPHQL_RETRY_STATUSES = (429, 500, 502, 503, 504)
+GRAPHQL_MAX_ATTEMPTS = 3
+GRAPHQL_RETRY_BACKOFF_SECONDS = 0.5
+GRAPHQL_CONNECT_TIMEOUT_SECONDS = 2.0
+
+# Time kept back from the Lambda timeout so a failed call still returns a CORS-enabled error
+RESPONSE_RESERVE_SECONDS = 1.0
+
+class GraphQLHTTPError(Exception):
+    """Raised when the GraphQL endpoint answers with an HTTP error status."""
+
+def invocation_deadline(context):
+    """Return the time.monotonic() value by which GraphQL calls in this invocation must finish."""
+    return time.monotonic() + context.get_remaining_time_in_millis() / 1000 - RESPONSE_RESERVE_SECONDS
+
+def retry_after_seconds(response):
+    """Return the response's Retry-After as seconds from now, or None if absent or invalid."""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+def graphql_call(access_token, query, variables, deadline, headers=None):
+    """Make authenticated GraphQL API call over the shared keep-alive connection pool.
+
+    Attempts and backoff waits stop at deadline, a time.monotonic() value. headers are
+    sent in addition to the authorization and content type headers.
+    """
+    logger.info("Starting GraphQL API call")
+
+    cache_key = (access_token, query, json.dumps(variables, sort_keys=True))
+    cached_response = get_cached_response(cache_key)
+    if cached_response is not None:
+        logger.info("Returning cached GraphQL response")
+        return cached_response
+
+    payload = {"query": query}
+    if variables:
+        payload["variables"] = variables
+        logger.info("GraphQL variables: %s", variables)
+
+    # Compact separators keep the request body free of padding whitespace
+    data = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    logger.debug("GraphQL payload size: %d bytes", len(data))
+
+    request_headers = {
+        "Authorization": f"Bearer {access_token[:10]}...",  # Log partial token for security
+        "Content-Type": "application/json",
+        **(headers or {})
+    }
+
+    logger.info("Making HTTP request to Meetup GraphQL API")
+
+    try:
+        for attempt in range(1, GRAPHQL_MAX_ATTEMPTS + 1):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("No time left for the GraphQL call")
+
+            try:
+                response = http.request(
+                    "POST",
+                    MEETUP_GRAPHQL_URL,
+                    body=data,
+                    headers=request_headers,
+                    timeout=urllib3.Timeout(total=remaining, connect=GRAPHQL_CONNECT_TIMEOUT_SECONDS)
+                )
+            except urllib3.exceptions.ConnectTimeoutError as e:
+                # Also covers connection failures (NewConnectionError)
+                if attempt == GRAPHQL_MAX_ATTEMPTS:
+                    raise
+                logger.warning("GraphQL connect failed (%s), retrying", e)
+                continue
+
+            if response.status not in GRAPHQL_RETRY_STATUSES or attempt == GRAPHQL_MAX_ATTEMPTS:
+                break
+            delay = random.uniform(0, GRAPHQL_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            retry_after = retry_after_seconds(response)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            if deadline - time.monotonic() <= delay:
+                break
+            logger.warning("GraphQL call returned %s, retrying in %.1fs", response.status, delay)
+            time.sleep(delay)
+
+        logger.info("HTTP response status: %s", response.status)
+        response_data = response.data
+
+        if response.status >= 400:
+            error_body = response_data.decode('utf-8')
+            logger.error("HTTP Error %s: %s", response.status, error_body)
+            raise GraphQLHTTPError(f"GraphQL call failed: {response.status} - {error_body}")
+
+        logger.debug("Response data size: %d bytes", len(response_data))
+
+        # json.loads accepts the raw UTF-8 bytes, avoiding an intermediate decoded copy
+        parsed_response = json.loads(response_data)
+        logger.info("Successfully parsed JSON response")
+
+        # Only cache complete answers; responses carrying GraphQL errors are retried next time
+        if 'errors' not in parsed_response:
+            cache_response(cache_key, parsed_response)
+        return parsed_response
+
+    except GraphQLHTTPError:
+        raise
+    except json.JSONDecodeError as e:
+        logger.error("JSON decode error: %s", e)
+        raise Exception(f"Failed to parse JSON response: {str(e)}")
+    except Exception as e:
+        logger.error("Unexpected error in GraphQL call: %s", e)
+        raise Exception(f"GraphQL call failed: {str(e)}")
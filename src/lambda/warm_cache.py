@@ -0,0 +1,66 @@
+"""Caches shared by the Lambda handlers that live as long as the execution environment."""
+import json
+import os
+import logging
+import threading
+import time
+import boto3
+from collections import OrderedDict
+
+logger = logging.getLogger()
+
+# In-memory LRU cache of GraphQL responses keyed on (token, query, variables). It lives as long
+# as the execution environment, so entries expire to keep warm invocations reasonably fresh.
+GRAPHQL_CACHE_MAX_ENTRIES = 256
+GRAPHQL_CACHE_TTL_SECONDS = 300
+graphql_cache = OrderedDict()
+graphql_cache_lock = threading.Lock()
+
+# Secrets Manager client shared by warm invocations; the fetched credentials are reused
+# until they expire so rotated values are still picked up. The region comes from the
+# function's AWS_REGION, so the secret is read from whichever region the stack is deployed to.
+secretsmanager_client = boto3.session.Session().client('secretsmanager')
+SECRET_CACHE_TTL_SECONDS = 300
+secret_cache = {}
+
+def get_cached_response(cache_key):
+    """Return a cached GraphQL response if it has not expired, else None."""
+    with graphql_cache_lock:
+        entry = graphql_cache.get(cache_key)
+        if entry is None:
+            return None
+        cached_at, response = entry
+        if time.monotonic() - cached_at > GRAPHQL_CACHE_TTL_SECONDS:
+            del graphql_cache[cache_key]
+            return None
+        graphql_cache.move_to_end(cache_key)
+        return response
+
+def cache_response(cache_key, response):
+    """Store a GraphQL response, evicting the least recently used entry when full."""
+    with graphql_cache_lock:
+        graphql_cache[cache_key] = (time.monotonic(), response)
+        graphql_cache.move_to_end(cache_key)
+        while len(graphql_cache) > GRAPHQL_CACHE_MAX_ENTRIES:
+            graphql_cache.popitem(last=False)
+
+def get_secret():
+    """Get credentials from AWS Secrets Manager."""
+    secret_name = os.environ.get('MEETUP_SECRET_NAME')
+    if not secret_name:
+        logger.error("MEETUP_SECRET_NAME environment variable not set")
+        return None
+
+    cached_secret = secret_cache.get(secret_name)
+    if cached_secret is not None and time.monotonic() - cached_secret[0] <= SECRET_CACHE_TTL_SECONDS:
+        return cached_secret[1]
+
+    try:
+        logger.info("Getting secret: %s", secret_name)
+        response = secretsmanager_client.get_secret_value(SecretId=secret_name)
+        secret = json.loads(response['SecretString'])
+        secret_cache[secret_name] = (time.monotonic(), secret)
+        return secret
+    except Exception as e:
+        logger.error("Error getting secret: %s", e)
+        return None
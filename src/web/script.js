@@ -1,4 +1,8 @@
 // Meetup Dashboard - Clean version without dummy data
+
+// API Gateway base URL (ApiGatewayUrl stack output), injected into the page at upload time
+const API_BASE_URL = document.querySelector('meta[name="api-base-url"]').content;
+
 document.addEventListener('DOMContentLoaded', function() {
     // Initialize Meetup functionality
     initializeMeetupIntegration();
@@ -28,13 +32,7 @@ function initializeMeetupIntegration() {
         
         try {
             // Use API Gateway endpoint
-            const response = await fetch('https://der8vsst03.execute-api.ap-southeast-2.amazonaws.com/prod/meetup', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify({})
-            });
+            const response = await fetch(`${API_BASE_URL}/meetup`);
             
             console.log('Response status:', response.status);
             
@@ -162,7 +160,7 @@ function toggleGroupDetails(groupId, index) {
 function fetchGroupDetails(groupId, index) {
     const content = document.getElementById(`content-${index}`);
     
-    fetch('https://der8vsst03.execute-api.ap-southeast-2.amazonaws.com/prod/group-details', {
+    fetch(`${API_BASE_URL}/group-details`, {
         method: 'POST',
         headers: {
             'Content-Type': 'application/json'